@@ -1,37 +1,278 @@
-import pandas as pd
+import csv
+import multiprocessing
 import os
+import queue
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk
 from tkinter.scrolledtext import ScrolledText
 import threading
 import traceback
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+# 리더 라이브러리(openpyxl, python_calamine)는 수백 ms짜리 임포트라 GUI 기동을
+# 늦추지 않도록 실제 변환 시점에 지연 임포트합니다. 모듈 캐시 덕에 두 번째
+# 호출부터는 비용이 없습니다.
+_calamine_checked = False
+_CalamineWorkbook = None
+
+
+def _load_calamine():
+    """python_calamine을 지연 임포트하고 CalamineWorkbook 클래스(없으면 None)를 반환합니다.
+
+    Rust 기반 리더로, 설치되어 있으면 openpyxl보다 훨씬 빠르게 파싱합니다.
+    특히 sharedStrings.xml을 파이썬 dict로 구체화하지 않고 효율적인 해시 인턴으로
+    처리하므로, 문자열 위주 시트에서는 파일당 수 배 빠르고 메모리도 크게 줄어듭니다.
+    """
+    global _calamine_checked, _CalamineWorkbook
+    if not _calamine_checked:
+        _calamine_checked = True
+        try:
+            from python_calamine import CalamineWorkbook
+        except ImportError:
+            CalamineWorkbook = None
+        _CalamineWorkbook = CalamineWorkbook
+    return _CalamineWorkbook
+
+
+_XLSX_SUFFIX = '.xlsx'
+
+# 재귀 탐색에서 건너뛸 디렉터리. 사용자 xlsx가 있을 일은 거의 없지만
+# 수십만 개의 항목을 가질 수 있는 트리들입니다. 숨김(.으로 시작) 폴더도 건너뜁니다.
+SKIP_DIRS = {
+    '.git', '.svn', 'node_modules', '__pycache__', '.venv', 'venv',
+    '$RECYCLE.BIN', 'System Volume Information',
+}
+
+
+def _is_xlsx(name):
+    """이름이 .xlsx로 끝나는지(대소문자 무시) 검사합니다.
+
+    마지막 다섯 글자만 소문자로 바꿔 비교하므로 긴 이름 전체를
+    복사하는 name.lower() 호출을 피합니다.
+    """
+    return len(name) >= 5 and name[-5:].lower() == _XLSX_SUFFIX
+
+
+def _walk_xlsx(path, append):
+    """os.scandir로 path를 재귀 탐색하여 .xlsx 파일 경로를 append로 모읍니다.
+
+    DirEntry의 d_type 캐시를 사용하므로(follow_symlinks=False) 항목마다
+    os.stat을 호출하는 os.walk보다 시스템 콜이 적습니다. append는 결과
+    리스트의 바인딩된 append 메서드를 받아 매 항목의 속성 조회를 피합니다.
+
+    읽을 수 없는 디렉터리는 os.walk의 기본 동작(onerror=None)처럼 조용히
+    건너뜁니다. 권한 없는 하위 폴더 하나 때문에 전체 탐색이 중단되면 안 됩니다.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    name = entry.name
+                    if name.startswith('.') or name in SKIP_DIRS:
+                        continue
+                    _walk_xlsx(entry.path, append)
+                elif _is_xlsx(entry.name) and entry.is_file(follow_symlinks=False):
+                    append(entry.path)
+    except OSError:
+        return
 
 
 def list_folder_recursive(path):
     """
-    주어진 경로를 재귀 탐색하여 모든 .xlsx 파일의 전체 경로 리스트를 반환합니다.
+    주어진 경로를 재귀 탐색하여 모든 .xlsx 파일의 경로 리스트를 반환합니다.
     만약 path가 파일이고 .xlsx로 끝난다면 해당 파일만 반환합니다.
+
+    반환 경로는 입력 path 기준입니다(상대면 상대, 절대면 절대). 예전처럼
+    단일 파일만 abspath로 바꾸지 않으므로 두 분기의 결과 형태가 같고,
+    os.getcwd() 시스템 콜도 아낍니다.
     """
+    path = os.fspath(path)
     xlsx_file_list = []
 
     if os.path.isfile(path):
-        if path.lower().endswith('.xlsx'):
-            xlsx_file_list.append(os.path.abspath(path))
-        return [], xlsx_file_list
+        if _is_xlsx(path):
+            xlsx_file_list.append(path)
+        return xlsx_file_list
+
+    _walk_xlsx(path, xlsx_file_list.append)
+    return xlsx_file_list
 
-    for root, dirs, files in os.walk(path):
-        for f in files:
-            if f.lower().endswith('.xlsx'):
-                xlsx_file_list.append(os.path.join(root, f))
 
-    return None, xlsx_file_list
+OUTPUT_FORMATS = ('csv', 'parquet', 'feather')
 
+# CSV 쓰기에서 writerows 한 번에 넘길 행 묶음 크기.
+BATCH_ROWS = 10_000
 
-def convert_xlsx_to_csv(input_path, output_dir, sheet_name=0, encoding='utf-8', log_callback=None):
+
+def _chunks(rows, size):
+    """행 이터러블을 size 길이의 리스트 묶음으로 잘라 냅니다."""
+    batch = []
+    append = batch.append
+    for row in rows:
+        append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+            append = batch.append
+    if batch:
+        yield batch
+
+
+def _write_csv_overlapped(rows, out_path, encoding):
+    """행 이터러블을 CSV로 쓰되, 파싱(생산)과 쓰기(소비)를 스레드로 겹칩니다.
+
+    생산 스레드가 행 묶음을 바운드 큐에 넣는 동안 호출 스레드는 큐를 비우며
+    writerows를 호출합니다. 파싱이 파일 쓰기를 기다리느라 멈추지 않고, 큐의
+    maxsize가 메모리 사용을 묶음 64개 이하로 제한합니다. 쓴 행 수를 반환합니다.
+
+    참고: pyarrow.csv.write_csv(멀티스레드 C++)는 DataFrame/Table을 먼저
+    만들어야 하고 출력이 UTF-8로 고정되어 cp949 같은 인코딩 옵션을 지원할 수
+    없으므로, CSV 경로는 스트리밍 csv.writer를 유지합니다.
+    """
+    q = queue.Queue(maxsize=64)
+    stop = threading.Event()
+    errors = []
+
+    def produce():
+        try:
+            for batch in _chunks(rows, BATCH_ROWS):
+                if stop.is_set():
+                    return
+                q.put(batch)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            q.put(None)
+
+    row_count = 0
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        with open(out_path, 'w', newline='', encoding=encoding, buffering=1 << 20) as fh:
+            writer = csv.writer(fh)
+            while (batch := q.get()) is not None:
+                writer.writerows(batch)
+                row_count += len(batch)
+    finally:
+        # 소비 쪽이 예외(인코딩 오류, 디스크 부족 등)로 먼저 빠져나가면 생산
+        # 스레드가 가득 찬 큐의 put에서 영원히 기다리므로, 중단을 알리고 큐를
+        # 비워 깨운 뒤 종료를 기다립니다. 정상 종료 때는 바로 join만 됩니다.
+        stop.set()
+        while producer.is_alive():
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                producer.join(timeout=0.05)
+        producer.join()
+    if errors:
+        raise errors[0]
+    return row_count
+
+
+def _disambiguate(out_path, seen):
+    """seen에 이미 있는 출력 경로에 ' (n)'을 붙여 고유한 경로를 만듭니다."""
+    root, ext = os.path.splitext(out_path)
+    n = 1
+    candidate = f"{root} ({n}){ext}"
+    while candidate in seen:
+        n += 1
+        candidate = f"{root} ({n}){ext}"
+    return candidate
+
+
+def _iter_sheet_rows(path, sheet_name):
+    """(시트 이름, 행 이터러블) 쌍을 낳는 제너레이터입니다.
+
+    sheet_name이 'all'이면 워크북을 한 번만 열고 모든 시트를 차례로 냅니다 —
+    ZIP 열기와 sharedStrings.xml 파싱이 시트 수와 무관하게 1회로 끝납니다.
+    pandas 기반 parquet/feather 출력도 pd.read_excel 대신 이 리더를 거칩니다.
+    calamine이면 파싱 중 GIL이 풀려 스레드 풀에서 실제로 병렬화되고,
+    openpyxl 폴백은 read_only/data_only 모드라 DOM 전체를 만들지 않습니다.
+    """
+    CalamineWorkbook = _load_calamine()
+    if CalamineWorkbook is not None:
+        wb = CalamineWorkbook.from_path(path)
+        if sheet_name == 'all':
+            for sn in wb.sheet_names:
+                yield sn, wb.get_sheet_by_name(sn).to_python(skip_empty_area=False)
+        elif isinstance(sheet_name, int):
+            yield sheet_name, wb.get_sheet_by_index(sheet_name).to_python(skip_empty_area=False)
+        else:
+            yield sheet_name, wb.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+        return
+
+    import openpyxl
+
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        if sheet_name == 'all':
+            for sn in wb.sheetnames:
+                yield sn, wb[sn].iter_rows(values_only=True)
+        elif isinstance(sheet_name, int):
+            yield sheet_name, wb.worksheets[sheet_name].iter_rows(values_only=True)
+        else:
+            yield sheet_name, wb[sheet_name].iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def _convert_one(path, out_path, sheet_name=0, encoding='utf-8', output_format='csv'):
+    """
+    단일 .xlsx 파일을 out_path(.csv/.parquet/.feather)로 변환하고
+    로그 문자열을 반환합니다. 출력 경로는 호출 측에서 미리 계산합니다.
+
+    sheet_name이 'all'이면 워크북의 모든 시트를 '이름__시트.확장자'로 저장합니다.
+
+    ProcessPoolExecutor 워커에서 실행되므로 최상위 함수(picklable)여야 합니다.
+    예외도 문자열로 돌려보내 메인 스레드가 순서대로 로깅하게 합니다.
+    """
+    try:
+        multi = sheet_name == 'all'
+        root, fext = os.path.splitext(out_path)
+        messages = []
+
+        for sn, rows in _iter_sheet_rows(path, sheet_name):
+            sheet_out = f"{root}__{sn}{fext}" if multi else out_path
+
+            if output_format == 'csv':
+                row_count = _write_csv_overlapped(rows, sheet_out, encoding)
+            else:
+                # parquet/feather는 컬럼 단위 포맷이라 DataFrame을 거칩니다.
+                # pandas/pyarrow는 이 포맷을 선택했을 때만 필요하므로 지연 임포트합니다.
+                import pandas as pd
+
+                rows = list(rows)
+                row_count = len(rows)
+                if rows:
+                    df = pd.DataFrame(rows[1:], columns=[str(c) for c in rows[0]])
+                else:
+                    df = pd.DataFrame()
+                if output_format == 'parquet':
+                    df.to_parquet(sheet_out, compression='zstd')
+                else:
+                    df.to_feather(sheet_out)
+
+            messages.append(f"'{path}' 파일의 시트 '{sn}'을(를) 읽었습니다. (총 {row_count} 행)\n"
+                            f"저장: {sheet_out}")
+
+        return '\n'.join(messages)
+
+    except Exception as e:
+        return f"변환 중 오류 ({path}): {e}\n" + traceback.format_exc()
+
+
+def convert_xlsx_to_csv(input_path, output_dir, sheet_name=0, encoding='utf-8',
+                        output_format='csv', log_callback=None):
     """
     input_path가 단일 파일일 수도 있고, 폴더일 수도 있습니다.
-    발견된 모든 .xlsx 파일을 읽어 output_dir에 같은 이름의 .csv로 저장합니다.
+    발견된 모든 .xlsx 파일을 읽어 output_dir에 같은 이름의 출력 파일로 저장합니다.
 
+    sheet_name: 시트 이름 또는 인덱스. 'all'이면 모든 시트를 각각
+                '이름__시트' 출력 파일로 저장합니다.
+    output_format: 'csv'(기본), 'parquet', 'feather' 중 하나.
+                   parquet/feather는 pandas와 pyarrow가 설치되어 있어야 합니다.
     log_callback: 선택적 함수로, 진행 로그를 받을 수 있습니다. (문자열 매개)
     """
 
@@ -57,7 +298,7 @@ def convert_xlsx_to_csv(input_path, output_dir, sheet_name=0, encoding='utf-8',
             log(f"출력 폴더 생성 실패: {e}")
             return
 
-    _, xlsx_files = list_folder_recursive(input_path)
+    xlsx_files = list_folder_recursive(input_path)
 
     if len(xlsx_files) == 0:
         log("변환할 .xlsx 파일을 찾지 못했습니다.")
@@ -67,22 +308,43 @@ def convert_xlsx_to_csv(input_path, output_dir, sheet_name=0, encoding='utf-8',
     log(f"입력 경로: {input_path}")
     log(f"출력 폴더: {output_dir}")
 
-    for path in xlsx_files:
-        try:
-            if not os.path.exists(path):
-                log(f"오류: 입력 파일 '{path}'이(가) 존재하지 않습니다. 건너뜁니다.")
-                continue
-
-            df = pd.read_excel(path, sheet_name=sheet_name)
-            log(f"'{path}' 파일의 시트 '{sheet_name}'을(를) 읽었습니다. (총 {len(df)} 행)")
-
-            base_name = os.path.splitext(os.path.basename(path))[0]
-            out_path = os.path.join(output_dir, base_name + '.csv')
-            df.to_csv(out_path, index=False, encoding=encoding)
-            log(f"저장: {out_path}")
-
-        except Exception as e:
-            log(f"변환 중 오류 ({path}): {e}\n" + traceback.format_exc())
+    # 출력 경로는 디스패치 전에 한 번에 계산합니다. 수만 개 파일 배치에서는
+    # os.path 속성 조회도 쌓이므로 지역 변수로 바인딩해 둡니다.
+    _join = os.path.join
+    _splitext = os.path.splitext
+    _basename = os.path.basename
+    # 서로 다른 하위 폴더에 같은 이름의 파일이 있으면 나중 파일이 앞의 출력을
+    # 덮어써 변환 작업이 헛수고가 되므로, 충돌하는 이름에는 ' (n)'을 붙입니다.
+    ext = '.' + output_format
+    out_paths = []
+    seen = set()
+    for p in xlsx_files:
+        out_path = _join(output_dir, _splitext(_basename(p))[0] + ext)
+        if out_path in seen:
+            out_path = _disambiguate(out_path, seen)
+        seen.add(out_path)
+        out_paths.append(out_path)
+
+    # 파일 간 의존성이 없으므로 워커 풀로 병렬 변환합니다.
+    # calamine은 Rust 코드라 파싱 중 GIL을 놓으므로 스레드 풀이면 충분하고,
+    # 순수 파이썬인 openpyxl 경로는 GIL을 계속 잡으므로 프로세스 풀을 씁니다.
+    # 워커는 로그 문자열만 반환하고, 로깅 자체는 호출 스레드에서 순서대로 수행합니다.
+    workers = os.cpu_count() or 1
+    if _load_calamine() is not None:
+        ex = ThreadPoolExecutor(max_workers=workers)
+    else:
+        # spawn은 플랫폼과 무관하게 동일하게 동작하고, Tk를 띄운 프로세스를
+        # fork할 때 생기는 문제를 피합니다.
+        ex = ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context('spawn'))
+    # 작은 파일이 아주 많은 배치에서는 작업당 IPC 왕복이 지배적이므로
+    # map을 묶음 단위로 디스패치합니다. (스레드 풀은 chunksize를 무시합니다.)
+    chunksize = max(1, len(xlsx_files) // (4 * workers))
+    convert = partial(_convert_one, sheet_name=sheet_name,
+                      encoding=encoding, output_format=output_format)
+    with ex:
+        for msg in ex.map(convert, xlsx_files, out_paths, chunksize=chunksize):
+            log(msg)
 
     log("--- 파일 변환 완료 ---")
 
@@ -110,7 +372,7 @@ class XlsxToCsvGUI(tk.Tk):
         # Options
         frame_opts = tk.Frame(self)
         frame_opts.pack(fill='x', padx=10)
-        tk.Label(frame_opts, text='시트(이름 또는 인덱스):').grid(row=0, column=0, sticky='w')
+        tk.Label(frame_opts, text="시트(이름/인덱스, 전체는 'all'):").grid(row=0, column=0, sticky='w')
         self.sheet_var = tk.StringVar(value='0')
         tk.Entry(frame_opts, textvariable=self.sheet_var, width=12).grid(row=0, column=1, sticky='w')
 
@@ -118,6 +380,11 @@ class XlsxToCsvGUI(tk.Tk):
         self.encoding_var = tk.StringVar(value='utf-8')
         tk.Entry(frame_opts, textvariable=self.encoding_var, width=12).grid(row=0, column=3, sticky='w')
 
+        tk.Label(frame_opts, text='출력 형식:').grid(row=0, column=4, sticky='w', padx=(10,0))
+        self.format_var = tk.StringVar(value='csv')
+        ttk.Combobox(frame_opts, textvariable=self.format_var, values=list(OUTPUT_FORMATS),
+                     state='readonly', width=10).grid(row=0, column=5, sticky='w')
+
         # Buttons
         frame_btns = tk.Frame(self)
         frame_btns.pack(fill='x', padx=10, pady=(6,0))
@@ -130,6 +397,10 @@ class XlsxToCsvGUI(tk.Tk):
         self.log_area.pack(fill='both', expand=True, padx=10, pady=(0,10))
         self.log_area.configure(state='disabled')
 
+        # 로그는 메시지마다 위젯을 건드리지 않고 버퍼에 모았다가 주기적으로 한 번에 붙입니다.
+        self._log_buf = deque()
+        self._log_flush_scheduled = False
+
         self.protocol('WM_DELETE_WINDOW', self.quit)
 
     def browse_input(self):
@@ -186,13 +457,31 @@ class XlsxToCsvGUI(tk.Tk):
             self.output_var.set(d)
 
     def log(self, msg):
-        def append():
-            self.log_area.configure(state='normal')
-            self.log_area.insert('end', msg + '\n')
-            self.log_area.see('end')
-            self.log_area.configure(state='disabled')
-
-        self.after(0, append)
+        # 수천 개 파일 배치에서 메시지마다 Tk 이벤트/위젯 갱신을 만들면 그 비용이
+        # 변환 자체를 넘어서므로, 버퍼에 쌓고 100ms마다 한 번만 insert합니다.
+        self._log_buf.append(msg)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after(100, self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_scheduled = False
+        # 스케줄러 스레드가 동시에 append할 수 있으므로 스냅샷 후 clear 대신
+        # 원자적인 popleft로 비웁니다. 드레인 중 들어온 메시지는 여기서 같이
+        # 나가거나, 새로 예약된 다음 flush가 가져갑니다.
+        lines = []
+        while True:
+            try:
+                lines.append(self._log_buf.popleft())
+            except IndexError:
+                break
+        if not lines:
+            return
+        text = '\n'.join(lines) + '\n'
+        self.log_area.configure(state='normal')
+        self.log_area.insert('end', text)
+        self.log_area.see('end')
+        self.log_area.configure(state='disabled')
 
     def start_convert(self):
         input_path = self.input_var.get().strip()
@@ -204,22 +493,31 @@ class XlsxToCsvGUI(tk.Tk):
             messagebox.showwarning('출력 필요', '출력 폴더를 선택하세요.')
             return
 
-        # parse sheet
+        # parse sheet: 숫자면 인덱스, 아니면 시트 이름('all' 포함), 비어 있으면 첫 시트
         sheet_raw = self.sheet_var.get().strip()
         try:
             sheet_val = int(sheet_raw)
-        except Exception:
-            sheet_val = sheet_raw if sheet_raw != '' else 0
+        except ValueError:
+            sheet_val = sheet_raw or 0
 
         encoding = self.encoding_var.get().strip() or 'utf-8'
+        output_format = self.format_var.get() or 'csv'
 
         # run conversion in background
-        t = threading.Thread(target=self._run_conversion_thread, args=(input_path, output_dir, sheet_val, encoding), daemon=True)
+        t = threading.Thread(target=self._run_conversion_thread,
+                             args=(input_path, output_dir, sheet_val, encoding, output_format),
+                             daemon=True)
         t.start()
 
-    def _run_conversion_thread(self, input_path, output_dir, sheet_val, encoding):
+    def _run_conversion_thread(self, input_path, output_dir, sheet_val, encoding, output_format):
+        # 이 스레드는 스케줄러 역할만 합니다. 실제 파싱/쓰기는 convert_xlsx_to_csv의
+        # 워커 풀에서 일어나고, 로그는 self.log의 버퍼 + 주기적 flush로 Tk 메인 루프에
+        # 넘어가므로 변환 중에도 UI가 멈추지 않습니다. 순수 파이썬 리더(openpyxl)일
+        # 때도 풀이 spawn 프로세스이므로 멀티코어를 씁니다 — 이 스레드 자체를
+        # multiprocessing.Process로 바꿔도 얻는 것이 없습니다.
         try:
-            convert_xlsx_to_csv(input_path, output_dir, sheet_name=sheet_val, encoding=encoding, log_callback=self.log)
+            convert_xlsx_to_csv(input_path, output_dir, sheet_name=sheet_val, encoding=encoding,
+                                output_format=output_format, log_callback=self.log)
             self.log('전체 작업이 완료되었습니다.')
         except Exception as e:
             self.log('예기치 않은 오류: ' + str(e) + '\n' + traceback.format_exc())